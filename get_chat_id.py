@@ -16,9 +16,13 @@ def get_chat_id():
     print(f"Step 2: Send a message (e.g., 'hello') to your bot.")
     input("Step 3: Press Enter here AFTER you have sent the message...")
 
+    # Long poll: Telegram answers as soon as an update exists, or after 30s.
+    # offset=-1 asks for only the most recent update.
     url = f"https://api.telegram.org/bot{token}/getUpdates"
+    params = {"timeout": 30, "offset": -1, "limit": 1}
     try:
-        response = requests.get(url, timeout=10)
+        print("Waiting for your message (up to 30 seconds)...")
+        response = requests.get(url, params=params, timeout=35)
         data = response.json()
         
         if not data.get('ok'):
@@ -27,11 +31,11 @@ def get_chat_id():
 
         results = data.get('result', [])
         if not results:
-            print("\nNo updates found!")
+            print("\nNo updates received within 30 seconds!")
             print("Troubleshooting:")
             print("1. Make sure you are messaging the correct bot.")
             print("2. Send another message to the bot.")
-            print("3. Wait a few seconds and try running this script again.")
+            print("3. Run this script again and send the message while it is waiting.")
             return
 
         # Look for the most recent message
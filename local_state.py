@@ -0,0 +1,46 @@
+"""
+Location of the files the scrapers keep between runs: the HTTP/detail cache,
+the seen-URL stores and the Chromium profile.
+"""
+
+import logging
+import os
+import stat
+import tempfile
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _state_dir():
+    """
+    Returns a per-user directory for local state, creating it if needed.
+
+    It lives in the system temp dir, which survives warm Cloud Function
+    invocations. That dir is shared with other users, so the subdirectory is
+    created 0700 and rejected unless it is a real directory we own and only we
+    can access; in that case a fresh private directory is used for this run.
+    """
+    if not hasattr(os, 'getuid'):
+        # Windows temp dirs are already per-user
+        return tempfile.gettempdir()
+
+    uid = os.getuid()
+    path = os.path.join(tempfile.gettempdir(), f'ai-updates-{uid}')
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logging.warning("Could not create state dir %s: %s", path, e)
+        return tempfile.mkdtemp(prefix='ai-updates-')
+
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+        logging.warning("Refusing state dir %s: not a private directory owned by us", path)
+        return tempfile.mkdtemp(prefix='ai-updates-')
+    return path
+
+
+def state_path(name):
+    """Returns the default path of the state file or directory `name`."""
+    return os.path.join(_state_dir(), name)
@@ -2,6 +2,52 @@ import logging
 from scraper import check_for_new_articles
 from notifier import send_telegram_notification
 
+# Telegram rejects messages over 4096 chars; leave headroom for Markdown
+MAX_MESSAGE_CHARS = 4000
+
+
+def format_article_line(art, limit=MAX_MESSAGE_CHARS):
+    """
+    Formats one article as a Markdown message line of at most `limit`
+    characters. An over-long title is shortened with an ellipsis so the
+    Markdown link stays intact; Telegram rejects unclosed entities.
+    """
+    title = art['title']
+    line = f"- *{art['source']}*: [{title}]({art['url']}) ({art['date']})"
+    excess = len(line) - limit
+    if excess <= 0:
+        return line
+    if excess < len(title):
+        title = title[:len(title) - excess - 1] + "…"
+        return f"- *{art['source']}*: [{title}]({art['url']}) ({art['date']})"
+    # Not even the bare link fits; send the title alone
+    logging.warning("URL too long to send, omitting link: %s", art['url'])
+    line = f"- *{art['source']}*: {title}"
+    return line if len(line) <= limit else line[:limit - 1] + "…"
+
+
+def chunk_lines(lines, limit=MAX_MESSAGE_CHARS):
+    """
+    Groups lines into newline-joined messages of at most `limit` characters,
+    splitting only on line boundaries. Each line must itself fit in `limit`.
+    """
+    chunks = []
+    current = []
+    size = 0
+    for line in lines:
+        # +1 for the joining newline
+        added = len(line) + (1 if current else 0)
+        if current and size + added > limit:
+            chunks.append("\n".join(current))
+            current = []
+            added = len(line)
+            size = 0
+        current.append(line)
+        size += added
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
 def main(request):
     """
     Cloud Function entry point.
@@ -20,13 +66,14 @@ def main(request):
         count = len(new_articles)
         msg_lines = [f"Found {count} new article(s):"]
         for art in new_articles:
-            msg_lines.append(f"- *{art['source']}*: [{art['title']}]({art['url']}) ({art['date']})")
+            msg_lines.append(format_article_line(art))
         
         message = "\n".join(msg_lines)
         logging.info(message)
         
-        # Send notification
-        send_telegram_notification(message)
+        # Send notification (one call per run unless it exceeds Telegram's limit)
+        for chunk in chunk_lines(msg_lines):
+            send_telegram_notification(chunk)
         
         return f"Sent notification for {count} articles."
     else:
@@ -2,14 +2,23 @@ import os
 import requests
 import logging
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
+# Shared session so warm invocations reuse pooled HTTPS connections to Telegram
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
 def send_telegram_notification(message):
     """
     Sends a message to a Telegram chat using a Bot.
     Requires TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID environment variables.
     """
+    if not message:
+        logging.info("Empty message. Skipping notification.")
+        return False
+
     bot_token = os.environ.get("TELEGRAM_BOT_TOKEN")
     chat_id = os.environ.get("TELEGRAM_CHAT_ID")
 
@@ -25,7 +34,7 @@ def send_telegram_notification(message):
     }
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = _session.post(url, json=payload, timeout=10)
         response.raise_for_status()
         logging.info("Telegram notification sent successfully.")
         return True
@@ -3,29 +3,139 @@ Playwright-based scraper for JavaScript-rendered websites.
 This module handles sites that require a headless browser to render content.
 """
 
+import asyncio
 import logging
+import os
 import re
+from collections import Counter
+from functools import lru_cache
 from datetime import datetime, timezone
-from dateutil import parser
+
+from local_state import state_path
+from seen_urls import MAX_CONSECUTIVE_OLD, load_seen_urls, save_seen_urls
 
 # Playwright is optional - only import when needed
 PLAYWRIGHT_AVAILABLE = False
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     pass
 
+# Uber card date: "DD Month / Region"
+_UBER_DATE_RE = re.compile(
+    r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s*/\s*\w+)',
+    re.IGNORECASE
+)
+
+# Extracts every blog card in one round-trip instead of several CDP calls per card.
+# Cheap href checks run first (category/navigation links, duplicates keyed
+# without the query string), then the h2/h3 lookup; innerText, which forces
+# layout, is only read for the cards that survive.
+_EXTRACT_CARDS_JS = """
+() => {
+    const cards = new Map();
+    for (const a of document.querySelectorAll('a[href*="/blog/"]')) {
+        const href = a.getAttribute('href');
+        if (!href) continue;
+        const key = href.split('?')[0];
+        if (key.includes('/blog/engineering/') && key.endsWith('engineering/')) continue;
+        if (key === '/blog/engineering') continue;
+        if (cards.has(key)) continue;
+        const heading = a.querySelector('h2, h3');
+        if (!heading) continue;
+        cards.set(key, {href: href, heading: heading, el: a});
+    }
+    const records = [];
+    for (const card of cards.values()) {
+        const title = (card.heading.innerText || '').trim();
+        if (!title) continue;
+        records.push({href: card.href, title: title, text: card.el.innerText || ''});
+    }
+    return records;
+}
+"""
+
+# Chromium profile kept across runs so the HTTP cache and cookies are reused
+PROFILE_DIR = os.environ.get('PLAYWRIGHT_PROFILE_DIR') or state_path('uber-scrape-profile')
+
+# Publication dates of cards seen in earlier runs, so cards older than the
+# cutoff can be skipped without parsing. Stored as {url: [pub_date, last_seen]}.
+SEEN_URLS_PATH = os.environ.get('UBER_SEEN_URLS_PATH') or state_path('uber_seen.json')
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Resource types the scraper never reads; aborting them cuts page load time
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'stylesheet', 'font', 'media'})
+
 
 def is_playwright_available():
     """Check if Playwright is installed and available."""
     return PLAYWRIGHT_AVAILABLE
 
 
-def parse_uber_date(date_str):
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts images, CSS, fonts and media."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class PlaywrightRunner:
+    """
+    Owns one Playwright instance and browser context for a whole scrape run,
+    so every Playwright source shares a single Chromium launch.
+    The browser is launched lazily on the first page request.
+
+    Usage:
+        async with PlaywrightRunner() as runner:
+            await scrape_with_playwright(source, cutoff_date, runner)
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self.context = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.context is not None:
+            await self.context.close()
+            self.context = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        return False
+
+    async def _get_context(self):
+        """Launches the browser once; concurrent callers wait on the lock."""
+        async with self._lock:
+            if self.context is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                # Launch browser in headless mode with a persistent profile
+                self.context = await self._playwright.chromium.launch_persistent_context(
+                    PROFILE_DIR,
+                    headless=True,
+                    user_agent=USER_AGENT
+                )
+                await self.context.route("**/*", _block_heavy_resources)
+        return self.context
+
+    async def new_page(self):
+        """Opens a fresh page in the shared browser context."""
+        context = await self._get_context()
+        return await context.new_page()
+
+
+def parse_uber_date(date_str, current_year=None):
     """
     Parse Uber Engineering blog date format.
     Examples: "6 January / Global", "15 December / Global"
+    `current_year` is appended when the string has no year; defaults to now.
     Returns a datetime object or None if parsing fails.
     """
     if not date_str:
@@ -35,75 +145,80 @@ def parse_uber_date(date_str):
     date_part = date_str.split('/')[0].strip()
     
     # Add current year if not present (Uber format doesn't include year)
-    if not re.search(r'\d{4}', date_part):
-        current_year = datetime.now().year
+    has_year = any(date_part[i:i + 4].isdigit() for i in range(len(date_part) - 3))
+    if not has_year:
+        if current_year is None:
+            current_year = datetime.now().year
         date_part = f"{date_part} {current_year}"
     
+    return _parse_uber_date_cached(date_part)
+
+
+@lru_cache(maxsize=512)
+def _parse_uber_date_cached(date_part):
+    """Parse a year-qualified date string. Cached since cards often share a date."""
     try:
-        pub_date = parser.parse(date_part)
+        try:
+            # Fast path: Uber always renders "DD Month"
+            pub_date = datetime.strptime(date_part, "%d %B %Y")
+        except ValueError:
+            from dateutil import parser
+            pub_date = parser.parse(date_part)
         if pub_date.tzinfo is None:
             pub_date = pub_date.replace(tzinfo=timezone.utc)
         return pub_date
     except Exception as e:
-        logging.warning(f"Could not parse Uber date '{date_str}': {e}")
+        logging.warning("Could not parse Uber date '%s': %s", date_part, e)
         return None
 
 
-def scrape_uber_engineering(source_config, cutoff_date):
+async def scrape_uber_engineering(source_config, cutoff_date, runner):
     """
     Scrape Uber Engineering blog using Playwright.
     
     Args:
         source_config: Dict with source configuration
         cutoff_date: datetime.date object for filtering articles
+        runner: Active PlaywrightRunner providing the browser context
         
     Returns:
         List of article dicts with keys: source, title, date, url, timestamp
     """
-    if not PLAYWRIGHT_AVAILABLE:
-        logging.error("Playwright is not installed. Run: pip install playwright && playwright install chromium")
-        return []
-    
     articles = []
+    skipped = Counter()
     url = source_config.get('url', 'https://www.uber.com/en-IN/blog/engineering/')
     base_url = source_config.get('base_url', 'https://www.uber.com')
     source_name = source_config.get('name', 'Uber Engineering')
     
-    logging.info(f"Scraping {source_name} with Playwright...")
+    logging.info("Scraping %s with Playwright...", source_name)
     
     try:
-        with sync_playwright() as p:
-            # Launch browser in headless mode
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
-            
-            # Navigate to the blog page
-            page.goto(url, wait_until='networkidle', timeout=30000)
+        page = await runner.new_page()
+        try:
+            # Navigate to the blog page. Trackers rarely let the network go idle,
+            # so don't wait for it; the selector below is the readiness signal.
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
             
-            # Wait for article cards to load
-            page.wait_for_selector('a[href*="/blog/"]', timeout=10000)
+            # Wait for article cards (blog links with a heading) to render
+            await page.wait_for_selector('a[href*="/blog/"] h2, a[href*="/blog/"] h3', timeout=10000)
             
             # Find all article cards - they are links containing blog posts
             # Uber's structure: cards with title, category tags, and date
-            article_cards = page.query_selector_all('a[href*="/blog/"]')
+            article_cards = await page.evaluate(_EXTRACT_CARDS_JS)
             
             seen_urls = set()
+            consecutive_old = 0
+            current_year = datetime.now(timezone.utc).year
+            known_urls = load_seen_urls(SEEN_URLS_PATH)
+            today = datetime.now(timezone.utc).date().isoformat()
+            cutoff_iso = cutoff_date.isoformat()
             
             for card in article_cards:
                 try:
-                    href = card.get_attribute('href')
+                    href = card['href']
                     if not href:
                         continue
                     
-                    # Skip category/navigation links
-                    if '/blog/engineering/' in href and href.endswith('engineering/'):
-                        continue
-                    if '/blog/engineering' == href.rstrip('/'):
-                        continue
-                    
                     # Build full URL
                     if href.startswith('/'):
                         full_url = f"{base_url}{href}"
@@ -113,41 +228,49 @@ def scrape_uber_engineering(source_config, cutoff_date):
                     # Remove query params for deduplication
                     clean_url = full_url.split('?')[0]
                     if clean_url in seen_urls:
+                        skipped['duplicate'] += 1
                         continue
                     seen_urls.add(clean_url)
                     
-                    # Get title from the card (usually h2 or h3)
-                    title_elem = card.query_selector('h2, h3')
-                    if not title_elem:
+                    # Known from an earlier run to be older than the cutoff
+                    known = known_urls.get(clean_url)
+                    if known and known[0] < cutoff_iso:
+                        known[1] = today
+                        skipped['old'] += 1
+                        consecutive_old += 1
+                        if consecutive_old >= MAX_CONSECUTIVE_OLD:
+                            break
                         continue
-                    title = title_elem.inner_text().strip()
+                    
+                    # Get title from the card (usually h2 or h3)
+                    title = card['title'].strip()
                     if not title:
+                        skipped['no_title'] += 1
                         continue
                     
                     # Get date - it's in a div/span after the title, format: "6 January / Global"
                     # Try to find text that matches the date pattern
-                    card_text = card.inner_text()
+                    card_text = card['text']
                     
-                    # Look for date pattern: "DD Month / Region"
-                    date_match = re.search(
-                        r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s*/\s*\w+)',
-                        card_text,
-                        re.IGNORECASE
-                    )
+                    # Look for date pattern: "DD Month / Region" (needs a '/')
+                    date_match = _UBER_DATE_RE.search(card_text) if '/' in card_text else None
                     
                     if not date_match:
-                        logging.debug(f"No date found for article: {title}")
+                        logging.debug("No date found for article: %s", title)
+                        skipped['no_date'] += 1
                         continue
                     
                     date_str = date_match.group(1)
-                    pub_date = parse_uber_date(date_str)
+                    pub_date = parse_uber_date(date_str, current_year)
                     
                     if not pub_date:
+                        skipped['bad_date'] += 1
                         continue
                     
                     # Check if article is within cutoff
                     if pub_date.date() >= cutoff_date:
-                        logging.info(f"New article found on {source_name}: {title} ({date_str})")
+                        consecutive_old = 0
+                        logging.info("New article found on %s: %s (%s)", source_name, title, date_str)
                         articles.append({
                             'source': source_name,
                             'title': title,
@@ -156,23 +279,32 @@ def scrape_uber_engineering(source_config, cutoff_date):
                             'timestamp': pub_date.isoformat()
                         })
                     else:
-                        logging.debug(f"Skipping old article: {title} ({date_str})")
+                        logging.debug("Skipping old article: %s (%s)", title, date_str)
+                        skipped['old'] += 1
+                        known_urls[clean_url] = [pub_date.date().isoformat(), today]
+                        # Cards are newest-first; stop once the archive starts
+                        consecutive_old += 1
+                        if consecutive_old >= MAX_CONSECUTIVE_OLD:
+                            break
                         
                 except Exception as e:
-                    logging.warning(f"Error parsing article card: {e}")
+                    logging.warning("Error parsing article card: %s", e)
+                    skipped['error'] += 1
                     continue
             
-            browser.close()
+            save_seen_urls(SEEN_URLS_PATH, known_urls)
+        finally:
+            await page.close()
             
     except Exception as e:
-        logging.error(f"Playwright scraping error for {source_name}: {e}")
+        logging.error("Playwright scraping error for %s: %s", source_name, e)
         return []
     
-    logging.info(f"Found {len(articles)} new articles from {source_name}")
+    logging.info("Found %d new articles from %s (skipped: %s)", len(articles), source_name, dict(skipped))
     return articles
 
 
-def scrape_with_playwright(source_config, cutoff_date):
+async def scrape_with_playwright(source_config, cutoff_date, runner):
     """
     Generic Playwright scraper dispatcher.
     Routes to specific scrapers based on source name/type.
@@ -180,6 +312,7 @@ def scrape_with_playwright(source_config, cutoff_date):
     Args:
         source_config: Dict with source configuration
         cutoff_date: datetime.date object for filtering articles
+        runner: Active PlaywrightRunner providing the browser context
         
     Returns:
         List of article dicts
@@ -187,9 +320,44 @@ def scrape_with_playwright(source_config, cutoff_date):
     source_name = source_config.get('name', '')
     
     if 'uber' in source_name.lower():
-        return scrape_uber_engineering(source_config, cutoff_date)
+        return await scrape_uber_engineering(source_config, cutoff_date, runner)
     
     # Add more site-specific scrapers here as needed
-    logging.warning(f"No Playwright scraper implemented for: {source_name}")
+    logging.warning("No Playwright scraper implemented for: %s", source_name)
     return []
 
+
+async def _scrape_all_with_playwright(sources, cutoff_date):
+    async with PlaywrightRunner() as runner:
+        results = await asyncio.gather(
+            *[scrape_with_playwright(source, cutoff_date, runner) for source in sources],
+            return_exceptions=True
+        )
+
+    articles = []
+    for source, result in zip(sources, results):
+        if isinstance(result, Exception):
+            logging.error("Playwright scraping failed for %s: %s", source.get('name'), result)
+            continue
+        articles.extend(result)
+    return articles
+
+
+def scrape_playwright_sources(sources, cutoff_date):
+    """
+    Scrapes all Playwright sources concurrently in one shared browser.
+    Page loads overlap, so wall time is roughly that of the slowest source.
+    
+    Args:
+        sources: List of source configuration dicts
+        cutoff_date: datetime.date object for filtering articles
+        
+    Returns:
+        List of article dicts from all sources
+    """
+    if not sources:
+        return []
+    if not PLAYWRIGHT_AVAILABLE:
+        logging.error("Playwright is not installed. Run: pip install playwright && playwright install chromium")
+        return []
+    return asyncio.run(_scrape_all_with_playwright(sources, cutoff_date))
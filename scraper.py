@@ -1,23 +1,52 @@
+import argparse
 import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+from lxml import etree
 from dateutil import parser
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+import io
+import json
 import logging
-import feedparser
-import ssl
-import xml.etree.ElementTree as ET
+import os
+import sqlite3
+from contextlib import closing
+from functools import lru_cache
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 
-# Import Playwright scraper module (optional dependency)
-from playwright_scraper import scrape_with_playwright, is_playwright_available
-
-# Workaround for SSL certificate verify failed on some systems
-if hasattr(ssl, '_create_unverified_context'):
-    ssl._create_default_https_context = ssl._create_unverified_context
+from local_state import state_path
+from seen_urls import MAX_CONSECUTIVE_OLD, load_seen_urls, save_seen_urls
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Shared HTTP session: keep-alive + connection pooling so repeated requests
+# to the same host reuse one TLS connection instead of re-handshaking.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+})
+
+# On-disk cache of article detail pages (title, publication date) across runs
+DETAIL_CACHE_PATH = os.environ.get('SCRAPE_CACHE_PATH') or state_path('scrape_cache.db')
+
+# Upper bound on sources scraped at the same time
+MAX_SOURCE_WORKERS = 8
+
+# Upper bound on concurrent detail-page fetches within one source
+DETAIL_FETCH_WORKERS = 8
+
 SOURCES = [
     {
         "name": "Anthropic Engineering",
@@ -39,75 +68,401 @@ SOURCES = [
     }
 ]
 
+@lru_cache(maxsize=8192)
 def normalize_url(url):
     """Normalizes URL for comparison (removes query params and trailing slashes)."""
     if not url: return ""
-    return url.split('?')[0].rstrip('/')
+    # Already canonical: nothing to strip, return the same object
+    if '?' not in url and not url.endswith('/'): return url
+    return url.partition('?')[0].rstrip('/')
+
+@lru_cache(maxsize=1024)
+def absolute_url(base_url, href):
+    """Resolves a (possibly relative) listing href against the source's base URL."""
+    return urljoin(base_url, href)
+
+# Human-readable article dates, e.g. "Nov 24, 2025" or "November 24, 2025"
+_MONTH_DATE_RE = re.compile(
+    r'((?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?'
+    r'|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},?\s+\d{4})',
+    re.IGNORECASE
+)
+_PUBLISHED_RE = re.compile(r'Published\s*' + _MONTH_DATE_RE.pattern, re.IGNORECASE)
+
+# Bytes fed to the listing pull parser at a time
+_LISTING_CHUNK_SIZE = 64 * 1024
+
+# Only elements with "date" in their class are needed from a generic detail page
+_DATE_CLASS_STRAINER = SoupStrainer(attrs={'class': re.compile('date')})
+
+# Compiled once: engineering-post links in a listing card, and a link's first heading
+_ENGINEERING_LINK_XPATH = etree.XPath('.//a[contains(@href, "/engineering/")]')
+_FIRST_HEADING_XPATH = etree.XPath('(.//h1 | .//h2 | .//h3 | .//h4)[1]')
+
+# Sitemaps use namespace http://www.sitemaps.org/schemas/sitemap/0.9
+_SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+# Formats seen on the monitored blogs, tried before falling back to dateutil
+_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d", "%a, %d %b %Y %H:%M:%S %z")
+
+@lru_cache(maxsize=1024)
+def _fast_parse_date(date_str):
+    """
+    Parses a date string, trying ISO 8601 and the known blog formats with
+    the C-implemented parsers before dateutil's slower heuristic parser.
+    Raises ValueError/OverflowError like parser.parse when nothing matches.
+    Results are cached; listing pages repeat a small set of date strings.
+    """
+    date_str = date_str.strip()
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return parser.parse(date_str)
 
-def fetch_sitemap_dates(sitemap_url):
-    """Fetches sitemap and returns a dict of {normalized_url: date_str}."""
-    logging.info(f"Fetching sitemap: {sitemap_url}")
+def _iso_date_before(value, cutoff_date):
+    """
+    True if an ISO 8601 date string falls before cutoff_date, judged from its
+    YYYY-MM-DD prefix alone. Non-ISO strings return False so the caller parses them.
+    A non-UTC offset can move the UTC date a day later, so those get a day of slack.
+    """
+    if cutoff_date is None:
+        return False
+    value = value.strip()
     try:
-        response = requests.get(sitemap_url, timeout=10)
-        response.raise_for_status()
+        prefix_date = date.fromisoformat(value[:10])
+    except ValueError:
+        return False
+    if len(value) > 10 and not value.endswith(('Z', '+00:00')):
+        prefix_date += timedelta(days=1)
+    return prefix_date < cutoff_date
+
+
+def fetch_sitemap_dates(sitemap_url, cutoff_date=None):
+    """
+    Fetches sitemap and returns a dict of {normalized_url: date_str}.
+    With a cutoff_date, URLs whose lastmod is before it are left out.
+    """
+    logging.info("Fetching sitemap: %s", sitemap_url)
+    try:
+        content, _ = _conditional_get(sitemap_url)
         
-        root = ET.fromstring(response.content)
-        # Sitemaps use namespace http://www.sitemaps.org/schemas/sitemap/0.9
-        ns = {'s': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+        # Stream <url> elements and free each one once read, so large
+        # sitemaps never hold the whole tree in memory
+        context = etree.iterparse(io.BytesIO(content), events=('end',), tag=_SITEMAP_NS + 'url')
         
+        # Bound once outside the loop, which runs once per sitemap URL
         sitemap_dates = {}
-        for url_tag in root.findall('s:url', ns):
-            loc = url_tag.find('s:loc', ns).text
-            lastmod_tag = url_tag.find('s:lastmod', ns)
-            if loc and lastmod_tag is not None:
-                sitemap_dates[normalize_url(loc)] = lastmod_tag.text
+        loc_tag, lastmod_tag = _SITEMAP_NS + 'loc', _SITEMAP_NS + 'lastmod'
+        for _, url_tag in context:
+            loc = url_tag.findtext(loc_tag)
+            lastmod = url_tag.findtext(lastmod_tag)
+            if loc and lastmod is not None and not _iso_date_before(lastmod, cutoff_date):
+                sitemap_dates[normalize_url(loc)] = lastmod
+            url_tag.clear()
+            parent = url_tag.getparent()
+            while url_tag.getprevious() is not None:
+                del parent[0]
         
-        logging.info(f"Loaded {len(sitemap_dates)} URLs from sitemap.")
+        logging.info("Loaded %d URLs from sitemap.", len(sitemap_dates))
         return sitemap_dates
     except Exception as e:
-        logging.error(f"Failed to fetch/parse sitemap: {e}")
+        logging.error("Failed to fetch/parse sitemap: %s", e)
         return {}
 
 
-def fetch_title_from_page(url):
+def _extract_title(soup):
     """
-    Fetches article title using stable meta tags (og:title) or <h1>.
+    Extracts an article title using stable meta tags (og:title) or <h1>.
     These are SEO-critical and rarely change, unlike CSS class names.
     """
+    # Priority 1: og:title meta tag (most stable, SEO-critical)
+    # Priority 2: twitter:title meta tag
+    for key, value in (('property', 'og:title'), ('name', 'twitter:title')):
+        meta = soup.find('meta', attrs={key: value})
+        if meta and meta.get('content'):
+            return meta['content'].strip()
+    
+    # Priority 3: <h1> element (semantic HTML, stable)
+    h1 = soup.find('h1')
+    if h1:
+        return h1.get_text(strip=True)
+    
+    # Priority 4: <title> tag (remove site suffix if present)
+    title_tag = soup.find('title')
+    if title_tag:
+        title = title_tag.get_text(strip=True)
+        # Remove common suffixes like " | Site Name" or " \ Site Name"
+        for sep in [' | ', ' \\ ', ' - ', ' – ']:
+            if sep in title:
+                title = title.split(sep)[0].strip()
+        return title
+    
+    return None
+
+
+def _machine_readable_dates(soup):
+    """
+    Yields publication date strings from article:published_time, <time datetime>
+    and JSON-LD datePublished, in that order.
+    """
+    date_meta = soup.find('meta', attrs={'property': 'article:published_time'})
+    if date_meta and date_meta.get('content'):
+        yield date_meta['content']
+    
+    time_tag = soup.find('time', datetime=True)
+    if time_tag:
+        yield time_tag['datetime']
+    
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            data = data.get('@graph', [data])
+        if not isinstance(data, list):
+            continue
+        for item in data:
+            if isinstance(item, dict) and isinstance(item.get('datePublished'), str):
+                yield item['datePublished']
+
+
+def _extract_published_date(soup):
+    """
+    Extracts the publication date from an article page.
+    Returns (pub_date, date_str), or (None, None) if no date is found.
+    """
+    # Try machine-readable dates first
+    for value in _machine_readable_dates(soup):
+        try:
+            pub_date = _fast_parse_date(value)
+            if pub_date.tzinfo is None:
+                pub_date = pub_date.replace(tzinfo=timezone.utc)
+            return pub_date, pub_date.strftime("%b %d, %Y")
+        except Exception:
+            continue
+    
+    # Try finding "Published <date>" text, in date-classed elements before
+    # walking the whole page
+    scopes = [*soup.find_all(class_=re.compile('date')), soup]
+    for scope in scopes:
+        published_match = _PUBLISHED_RE.search(scope.get_text())
+        if not published_match:
+            continue
+        date_str = published_match.group(1)
+        try:
+            pub_date = _fast_parse_date(date_str)
+            if pub_date.tzinfo is None:
+                pub_date = pub_date.replace(tzinfo=timezone.utc)
+            return pub_date, date_str
+        except Exception:
+            pass
+    
+    return None, None
+
+
+def _open_detail_cache():
+    conn = sqlite3.connect(DETAIL_CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS article_details ("
+        "url TEXT PRIMARY KEY, title TEXT, pub_date TEXT, date_str TEXT, fetched_at TEXT)"
+    )
+    return conn
+
+
+def _load_cached_details(url):
+    """Returns (title, pub_date, date_str) from the on-disk cache, or None."""
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Priority 1: og:title meta tag (most stable, SEO-critical)
-        og_title = soup.select_one('meta[property="og:title"]')
-        if og_title and og_title.get('content'):
-            return og_title.get('content').strip()
-        
-        # Priority 2: twitter:title meta tag
-        twitter_title = soup.select_one('meta[name="twitter:title"]')
-        if twitter_title and twitter_title.get('content'):
-            return twitter_title.get('content').strip()
-        
-        # Priority 3: <h1> element (semantic HTML, stable)
-        h1 = soup.select_one('h1')
-        if h1:
-            return h1.get_text(strip=True)
-        
-        # Priority 4: <title> tag (remove site suffix if present)
-        title_tag = soup.select_one('title')
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-            # Remove common suffixes like " | Site Name" or " \ Site Name"
-            for sep in [' | ', ' \\ ', ' - ', ' – ']:
-                if sep in title:
-                    title = title.split(sep)[0].strip()
-            return title
-        
+        with closing(_open_detail_cache()) as conn:
+            row = conn.execute(
+                "SELECT title, pub_date, date_str FROM article_details WHERE url = ?", (url,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logging.warning("Could not read detail cache: %s", e)
         return None
-    except Exception as e:
-        logging.warning(f"Failed to fetch title from {url}: {e}")
+    if not row:
         return None
+    title, pub_date, date_str = row
+    return title, datetime.fromisoformat(pub_date), date_str
+
+
+def _store_cached_details(url, title, pub_date, date_str):
+    try:
+        with closing(_open_detail_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO article_details VALUES (?, ?, ?, ?, ?)",
+                (url, title, pub_date.isoformat(), date_str, datetime.now(timezone.utc).isoformat())
+            )
+    except sqlite3.Error as e:
+        logging.warning("Could not write detail cache: %s", e)
+
+
+# Page bodies fetched during the current check_for_new_articles run, so a
+# URL reached from several places is downloaded only once
+_html_cache = {}
+
+
+def _declared_charset(response):
+    """The charset from the Content-Type header, or None if it declares none."""
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return requests.utils.get_encoding_from_headers(response.headers)
+    return None
+
+
+def _get(url):
+    """
+    Returns (body, charset) for url, fetching it at most once per run.
+    charset is None unless the Content-Type header declares one.
+    """
+    if url in _html_cache:
+        return _html_cache[url]
+    response = SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    _html_cache[url] = (response.content, _declared_charset(response))
+    return _html_cache[url]
+
+
+def _get_soup(url, parse_only=None):
+    """
+    Parses url with lxml, passing the declared charset so BeautifulSoup can
+    skip encoding detection. parse_only is an optional SoupStrainer.
+    """
+    content, charset = _get(url)
+    return BeautifulSoup(content, 'lxml', from_encoding=charset, parse_only=parse_only)
+
+
+def _open_http_cache():
+    conn = sqlite3.connect(DETAIL_CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS http_cache ("
+        "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, charset TEXT)"
+    )
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(http_cache)")}
+    if 'charset' not in columns:
+        # Caches written before the charset was stored
+        conn.execute("ALTER TABLE http_cache ADD COLUMN charset TEXT")
+    return conn
+
+
+def _conditional_get(url):
+    """
+    GETs url with the validators stored from the previous run and returns
+    (body, charset), charset as in _get. A 304 Not Modified reuses the cached
+    body and charset instead of downloading them again. Network errors
+    propagate.
+    """
+    cached = None
+    try:
+        with closing(_open_http_cache()) as conn:
+            cached = conn.execute(
+                "SELECT etag, last_modified, body, charset FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logging.warning("Could not read HTTP cache: %s", e)
+
+    headers = {}
+    if cached:
+        etag, last_modified = cached[:2]
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    response = SESSION.get(url, headers=headers, timeout=10)
+    if response.status_code == 304 and cached:
+        logging.debug("Not modified since last run: %s", url)
+        return cached[2], cached[3]
+    response.raise_for_status()
+    charset = _declared_charset(response)
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        try:
+            with closing(_open_http_cache()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache "
+                    "(url, etag, last_modified, body, charset) VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, response.content, charset)
+                )
+        except sqlite3.Error as e:
+            logging.warning("Could not write HTTP cache: %s", e)
+    return response.content, charset
+
+
+# Complete (title, pub_date, date_str) results kept for the life of the process
+_details_cache = {}
+
+
+def fetch_article_details(url):
+    """
+    Fetches an article page and returns (title, pub_date, date_str); missing
+    values are None. Published articles don't change, so complete results
+    are cached in memory and on disk. Incomplete results and network errors
+    are not cached, so the next run tries again.
+    """
+    if url in _details_cache:
+        return _details_cache[url]
+    cached = _load_cached_details(url)
+    if cached:
+        _details_cache[url] = cached
+        return cached
+    
+    soup = _get_soup(url)
+    
+    title = _extract_title(soup)
+    pub_date, date_str = _extract_published_date(soup)
+    if title and pub_date:
+        _store_cached_details(url, title, pub_date, date_str)
+        _details_cache[url] = (title, pub_date, date_str)
+    return title, pub_date, date_str
+
+
+def _fetch_article_details_or_none(url):
+    """fetch_article_details that logs and returns (None, None, None) on failure."""
+    logging.debug("Fetching detail page for: %s", url)
+    try:
+        return fetch_article_details(url)
+    except Exception as e:
+        logging.debug("Could not fetch detail page %s: %s", url, e)
+        return None, None, None
+
+
+def _iter_listing_articles(content, encoding=None):
+    """
+    Yields each <article> element of an HTML listing as soon as the pull
+    parser has seen its closing tag, then frees it. Stopping iteration early
+    stops parsing the rest of the page. encoding is the declared charset;
+    without one, the page's <meta> charset is used, then UTF-8.
+    """
+    if not encoding:
+        encoding = EncodingDetector.find_declared_encoding(content, is_html=True) or 'utf-8'
+    try:
+        parser = etree.HTMLPullParser(events=('end',), tag='article', encoding=encoding)
+    except LookupError:
+        # Charset name libxml2 doesn't know
+        parser = etree.HTMLPullParser(events=('end',), tag='article', encoding='utf-8')
+    for start in range(0, len(content), _LISTING_CHUNK_SIZE):
+        parser.feed(content[start:start + _LISTING_CHUNK_SIZE])
+        for _, element in parser.read_events():
+            yield element
+            element.clear()
+    parser.close()
+    for _, element in parser.read_events():
+        yield element
+
+
+def _element_text(element, strip=False):
+    """Text of an lxml element and its descendants, like BeautifulSoup's get_text."""
+    if strip:
+        return ''.join(text.strip() for text in element.itertext())
+    return ''.join(element.itertext())
 
 
 def scrape_anthropic_engineering(source, cutoff_date):
@@ -128,19 +483,23 @@ def scrape_anthropic_engineering(source, cutoff_date):
     page_url = source.get('url', 'https://www.anthropic.com/engineering')
     
     try:
-        response = requests.get(page_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Strategy 1: Find all <article> elements (semantic HTML)
-        article_elements = soup.select('article')
-        logging.info(f"Found {len(article_elements)} <article> elements on {source_name}")
+        content, charset = _conditional_get(page_url)
         
+        # Pass 1: collect candidates from the listing DOM only (no network).
+        # Strategy 1: <article> elements (semantic HTML), streamed one at a time
+        candidates = []
         seen_urls = set()
+        article_count = 0
+        consecutive_old = 0
         
-        for article_elem in article_elements:
+        for article_elem in _iter_listing_articles(content, charset):
+            if consecutive_old >= MAX_CONSECUTIVE_OLD:
+                # Cards are newest-first; the rest of the page is older
+                logging.info("Reached articles older than the cutoff on %s, stopping", source_name)
+                break
+            article_count += 1
             # Find links to engineering articles
-            links = article_elem.select('a[href*="/engineering/"]')
+            links = _ENGINEERING_LINK_XPATH(article_elem)
             
             for link in links:
                 href = link.get('href', '')
@@ -150,308 +509,435 @@ def scrape_anthropic_engineering(source, cutoff_date):
                     continue
                     
                 # Build full URL
-                if href.startswith('/'):
-                    full_url = f"{base_url}{href}"
-                else:
-                    full_url = href
+                full_url = absolute_url(base_url, href)
                 
                 # Deduplicate
-                clean_url = full_url.split('?')[0].rstrip('/')
+                clean_url = normalize_url(full_url)
                 if clean_url in seen_urls:
                     continue
                 seen_urls.add(clean_url)
                 
                 # Extract title - try heading in the link first
                 title = None
-                title_elem = link.select_one('h1, h2, h3, h4')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
+                headings = _FIRST_HEADING_XPATH(link)
+                if headings:
+                    title = _element_text(headings[0], strip=True)
                 
                 # Extract date - look for date pattern in link text
                 # Common formats: "Nov 24, 2025", "November 24, 2025"
-                link_text = link.get_text()
-                date_match = re.search(
-                    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})',
-                    link_text,
-                    re.IGNORECASE
-                )
+                link_text = _element_text(link)
+                date_match = _MONTH_DATE_RE.search(link_text)
                 
                 pub_date = None
                 date_str = None
                 if date_match:
                     date_str = date_match.group(1)
                     try:
-                        pub_date = parser.parse(date_str)
+                        pub_date = _fast_parse_date(date_str)
                         if pub_date.tzinfo is None:
                             pub_date = pub_date.replace(tzinfo=timezone.utc)
                     except Exception:
                         pass
-                
-                # If no title or date, fetch from detail page
-                if not title or not pub_date:
-                    logging.debug(f"Fetching detail page for: {clean_url}")
-                    try:
-                        detail_resp = requests.get(clean_url, timeout=10)
-                        detail_resp.raise_for_status()
-                        detail_soup = BeautifulSoup(detail_resp.content, 'html.parser')
-                        
-                        # Get title from og:title (most reliable)
-                        if not title:
-                            title = fetch_title_from_page(clean_url)
-                        
-                        # Get date from detail page - look for date patterns
-                        if not pub_date:
-                            # Try meta tag first
-                            date_meta = detail_soup.select_one('meta[property="article:published_time"]')
-                            if date_meta and date_meta.get('content'):
-                                try:
-                                    pub_date = parser.parse(date_meta.get('content'))
-                                    if pub_date.tzinfo is None:
-                                        pub_date = pub_date.replace(tzinfo=timezone.utc)
-                                    date_str = pub_date.strftime("%b %d, %Y")
-                                except Exception:
-                                    pass
-                            
-                            # Try finding text with "Published" or date pattern
-                            if not pub_date:
-                                page_text = detail_soup.get_text()
-                                published_match = re.search(
-                                    r'Published\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})',
-                                    page_text,
-                                    re.IGNORECASE
-                                )
-                                if published_match:
-                                    date_str = published_match.group(1)
-                                    try:
-                                        pub_date = parser.parse(date_str)
-                                        if pub_date.tzinfo is None:
-                                            pub_date = pub_date.replace(tzinfo=timezone.utc)
-                                    except Exception:
-                                        pass
-                    except Exception as e:
-                        logging.debug(f"Could not fetch detail page {clean_url}: {e}")
-                
-                # Skip if we still don't have required data
-                if not title:
-                    logging.debug(f"Skipping article without title: {clean_url}")
-                    continue
-                if not pub_date:
-                    logging.debug(f"Skipping article without date: {title}")
+
+                # Already too old per the listing date - no detail fetch needed
+                if pub_date and pub_date.date() < cutoff_date:
+                    logging.debug("Skipping old article: %s (%s)", title or clean_url, date_str)
+                    consecutive_old += 1
                     continue
-                
-                # Check if within cutoff
-                if pub_date.date() >= cutoff_date:
-                    logging.info(f"New article found on {source_name}: {title} ({date_str})")
-                    articles.append({
-                        'source': source_name,
-                        'title': title,
-                        'date': date_str if date_str else pub_date.strftime("%Y-%m-%d"),
-                        'url': clean_url,
-                        'timestamp': pub_date.isoformat()
-                    })
+                if pub_date:
+                    consecutive_old = 0
+
+                candidates.append({
+                    'url': clean_url,
+                    'title': title,
+                    'pub_date': pub_date,
+                    'date_str': date_str,
+                })
+        
+        logging.info("Parsed %d <article> elements on %s", article_count, source_name)
+        
+        # Pass 2: fetch detail pages for candidates missing a title or date,
+        # concurrently so the round-trips overlap
+        missing = [c for c in candidates if not c['title'] or not c['pub_date']]
+        if missing:
+            with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+                details = executor.map(_fetch_article_details_or_none, [c['url'] for c in missing])
+                for candidate, (detail_title, detail_date, detail_date_str) in zip(missing, details):
+                    if not candidate['title']:
+                        candidate['title'] = detail_title
+                    if not candidate['pub_date'] and detail_date:
+                        candidate['pub_date'] = detail_date
+                        candidate['date_str'] = detail_date_str
+        
+        # Pass 3: apply the cutoff filter
+        for candidate in candidates:
+            clean_url = candidate['url']
+            title = candidate['title']
+            pub_date = candidate['pub_date']
+            date_str = candidate['date_str']
+            
+            # Skip if we still don't have required data
+            if not title:
+                logging.debug("Skipping article without title: %s", clean_url)
+                continue
+            if not pub_date:
+                logging.debug("Skipping article without date: %s", title)
+                continue
+            
+            # Check if within cutoff
+            if pub_date.date() >= cutoff_date:
+                logging.info("New article found on %s: %s (%s)", source_name, title, date_str)
+                articles.append({
+                    'source': source_name,
+                    'title': title,
+                    'date': date_str if date_str else pub_date.strftime("%Y-%m-%d"),
+                    'url': clean_url,
+                    'timestamp': pub_date.isoformat()
+                })
                         
     except Exception as e:
-        logging.error(f"Error scraping {source_name}: {e}")
+        logging.error("Error scraping %s: %s", source_name, e)
     
     return articles
 
+def _entry_link(entry):
+    """Returns the alternate link of an Atom entry or the <link> text of an RSS item."""
+    for link in entry.iterfind('{*}link'):
+        href = link.get('href')
+        if href is None:
+            if link.text and link.text.strip():
+                return link.text.strip()
+            continue
+        if link.get('rel', 'alternate') == 'alternate':
+            return href
+    return None
+
+
+def _parse_feed(xml_bytes):
+    """
+    Parses an Atom or RSS document into a list of
+    {'title', 'link', 'published'} dicts. Falls back to feedparser for
+    documents lxml rejects as malformed.
+    """
+    try:
+        root = etree.fromstring(xml_bytes)
+    except etree.XMLSyntaxError:
+        import feedparser  # Slow to import; only needed for malformed feeds
+        feed = feedparser.parse(xml_bytes)
+        entries = []
+        for entry in feed.entries:
+            date_struct = entry.get('published_parsed') or entry.get('updated_parsed')
+            entries.append({
+                'title': entry.get('title'),
+                'link': entry.get('link'),
+                'published': datetime(*date_struct[:6], tzinfo=timezone.utc).isoformat() if date_struct else None,
+            })
+        return entries
+
+    entries = []
+    for entry in root.iter('{*}entry', '{*}item'):
+        # itertext also covers type="xhtml" titles wrapped in a <div>
+        title_elem = entry.find('{*}title')
+        entries.append({
+            'title': ''.join(title_elem.itertext()).strip() if title_elem is not None else '',
+            'link': _entry_link(entry),
+            # {*}date is Dublin Core dc:date, used by RSS 1.0 and some RSS 2.0 feeds
+            'published': (entry.findtext('{*}published') or entry.findtext('{*}pubDate')
+                          or entry.findtext('{*}date') or entry.findtext('{*}updated')),
+        })
+    return entries
+
+
+def scrape_feed_source(source, cutoff_date):
+    """
+    Scrapes an RSS/Atom feed source, falling back to the sitemap for
+    entries without a date.
+    """
+    articles = []
+    # Feed Parsing (RSS/Atom), fetched through the shared session
+    try:
+        content, _ = _conditional_get(source['url'])
+        entries = _parse_feed(content)
+        logging.info("Found %d entries in feed for %s.", len(entries), source['name'])
+
+        # Sitemap is loaded on the first entry without a usable feed date
+        # (only URLs modified since the cutoff)
+        sitemap_dates = None
+
+        for entry in entries:
+            title = entry['title']
+            link = entry['link']
+            if not link:
+                continue
+
+            # Cheap prefix check so old ISO-dated entries skip the full parse
+            if entry['published'] and _iso_date_before(entry['published'], cutoff_date):
+                logging.debug("Skipping old article: %s", title)
+                continue
+
+            pub_date = None
+            if entry['published']:
+                try:
+                    pub_date = _fast_parse_date(entry['published'])
+                    if pub_date.tzinfo is None:
+                        pub_date = pub_date.replace(tzinfo=timezone.utc)
+                    # Report feed dates in UTC, as feedparser did
+                    pub_date = pub_date.astimezone(timezone.utc)
+                except Exception:
+                    logging.warning("Could not parse feed date for %s: %s", link, entry['published'])
+            if not pub_date and source.get('sitemap_url'):
+                # Fallback to sitemap lookup
+                if sitemap_dates is None:
+                    sitemap_dates = fetch_sitemap_dates(source['sitemap_url'], cutoff_date)
+                norm_link = normalize_url(link)
+                if norm_link in sitemap_dates:
+                    date_str = sitemap_dates[norm_link]
+                    try:
+                        pub_date = _fast_parse_date(date_str)
+                        if pub_date.tzinfo is None:
+                            pub_date = pub_date.replace(tzinfo=timezone.utc)
+                    except Exception:
+                        logging.warning("Could not parse sitemap date for %s: %s", link, date_str)
+
+            if not pub_date:
+                if sitemap_dates is not None:
+                    # The sitemap only keeps URLs modified since the cutoff
+                    logging.debug("No recent date found for entry: %s", title)
+                else:
+                    logging.warning("No date found for entry: %s", title)
+                continue
+
+            # Compare dates only (ignore time)
+            if pub_date.date() >= cutoff_date:
+                logging.info("New article found on %s: %s (%s)", source['name'], title, pub_date)
+                articles.append({
+                    'source': source['name'],
+                    'title': title,
+                    'date': pub_date.strftime("%Y-%m-%d"),
+                    'url': link,
+                    'timestamp': pub_date.isoformat()
+                })
+            else:
+                logging.debug("Skipping old article: %s", title)
+
+    except Exception as e:
+        logging.warning("Error parsing feed for %s: %s", source['name'], e)
+
+    return articles
+
+
+def _fetch_detail_date_str(link, title):
+    """
+    Returns the date text of the first element with "date" in its class on
+    the detail page, or None (with a warning) if it can't be found.
+    """
+    try:
+        detail_soup = _get_soup(link, parse_only=_DATE_CLASS_STRAINER)
+    except Exception as e:
+        logging.warning("Failed to fetch detail page for %s: %s", link, e)
+        return None
+    # Try to find date in detail page - look for element with "date" in class
+    detail_date_tag = detail_soup.select_one('[class*="date"]')
+    if not detail_date_tag:
+        logging.warning("Could not find date in detail page for: %s", title)
+        return None
+    return detail_date_tag.get_text(strip=True).replace('Published', '').strip()
+
+
+def scrape_html_source(source, cutoff_date):
+    """
+    Scrapes a listing page using the CSS selectors from the source config,
+    fetching the detail page when a listing entry has no date.
+    """
+    articles = []
+    # HTML Scraping (Anthropic)
+    try:
+        content, charset = _conditional_get(source['url'])
+    except requests.RequestException as e:
+        logging.error("Failed to fetch %s: %s", source['url'], e)
+        return articles
+
+    soup = BeautifulSoup(content, 'lxml', from_encoding=charset)
+    listing = soup.select(source['article_selector'])
+    logging.info("Found %d articles on %s.", len(listing), source['name'])
+
+    # Pass 1: title, link and listing date from the listing DOM (no network)
+    entries = []
+    for article in listing:
+        try:
+            # Title
+            title_tag = article.select_one(source['title_selector'])
+            if not title_tag:
+                continue
+            title = title_tag.get_text(strip=True)
+
+            # Link
+            if source['link_selector']:
+                link_tag = article.select_one(source['link_selector'])
+                link = link_tag.get('href') if link_tag else None
+            else:
+                link = article.get('href')
+
+            if link:
+                link = absolute_url(source.get('base_url', ''), link)
+
+            # Date - use the date_selector from config
+            date_tag = article.select_one(source['date_selector'])
+            date_str = date_tag.get_text(strip=True) if date_tag else None
+
+            if not date_str:
+                # Fallback: Fetch detail page if date is missing (e.g. Featured articles)
+                if not link:
+                    logging.warning("Could not find link for date fallback: %s", title)
+                    continue
+                logging.info("Date missing for '%s', fetching detail page...", title)
+
+            entries.append({'title': title, 'link': link, 'date_str': date_str})
+        except Exception as e:
+            logging.warning("Error parsing an article on %s: %s", source['name'], e)
+            continue
+
+    # Pass 2: fetch detail pages for entries without a listing date, concurrently
+    missing = [entry for entry in entries if not entry['date_str']]
+    if missing:
+        with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+            date_strs = executor.map(
+                _fetch_detail_date_str,
+                [entry['link'] for entry in missing],
+                [entry['title'] for entry in missing]
+            )
+            for entry, date_str in zip(missing, date_strs):
+                entry['date_str'] = date_str
+
+    # Pass 3: parse dates and apply the cutoff
+    for entry in entries:
+        title, link, date_str = entry['title'], entry['link'], entry['date_str']
+        if not date_str:
+            continue
+
+        # Parse date
+        try:
+            pub_date = _fast_parse_date(date_str)
+        except Exception:
+            logging.debug("Could not parse date: %s", date_str)
+            continue
+
+        if pub_date.tzinfo is None:
+            pub_date = pub_date.replace(tzinfo=timezone.utc)
+
+        # Compare dates only (ignore time)
+        if pub_date.date() >= cutoff_date:
+            logging.info("New article found on %s: %s (%s)", source['name'], title, date_str)
+            articles.append({
+                'source': source['name'],
+                'title': title,
+                'date': date_str,
+                'url': link,
+                'timestamp': pub_date.isoformat()
+            })
+        else:
+            logging.debug("Skipping old article: %s (%s)", title, date_str)
+
+    return articles
+
+
+def scrape_source(source, cutoff_date):
+    """Routes a non-Playwright source to its scraper. Returns a list of article dicts."""
+    logging.info("Checking %s...", source['name'])
+    source_type = source.get('type')
+
+    if source_type == 'anthropic':
+        # Custom robust scraper for Anthropic (uses semantic HTML + meta tags)
+        try:
+            return scrape_anthropic_engineering(source, cutoff_date)
+        except Exception as e:
+            logging.error("Anthropic scraping failed: %s", e)
+            return []
+
+    if source_type == 'feed':
+        return scrape_feed_source(source, cutoff_date)
+
+    return scrape_html_source(source, cutoff_date)
+
+
+def _scrape_playwright_group(sources, cutoff_date):
+    """Scrapes all Playwright sources together in one shared browser."""
+    # Imported here so runs without Playwright sources skip loading the browser runtime
+    from playwright_scraper import scrape_playwright_sources, is_playwright_available
+    if not is_playwright_available():
+        for source in sources:
+            logging.warning("Skipping %s: Playwright not installed", source['name'])
+        return []
+    for source in sources:
+        logging.info("Checking %s...", source['name'])
+    try:
+        return scrape_playwright_sources(sources, cutoff_date)
+    except Exception as e:
+        logging.error("Playwright scraping failed: %s", e)
+        return []
+
+
 def check_for_new_articles(lookback_hours=24):
     """
     Scrapes configured blogs and checks for articles published
     within the last `lookback_hours`.
+    Sources are fetched concurrently since the work is network-bound.
     """
-    logging.info(f"Checking for articles published in the last {lookback_hours} hours...")
+    logging.info("Checking for articles published in the last %d hours...", lookback_hours)
     
-    all_new_articles = []
     now = datetime.now(timezone.utc)
     # Calculate cutoff date (ignoring time)
     cutoff_date = (now - timedelta(hours=lookback_hours)).date()
 
-    for source in SOURCES:
-        logging.info(f"Checking {source['name']}...")
-        
-        if source.get('type') == 'anthropic':
-            # Custom robust scraper for Anthropic (uses semantic HTML + meta tags)
-            try:
-                anthropic_articles = scrape_anthropic_engineering(source, cutoff_date)
-                all_new_articles.extend(anthropic_articles)
-            except Exception as e:
-                logging.error(f"Anthropic scraping failed: {e}")
-            continue
-        
-        elif source.get('type') == 'playwright':
-            # Playwright-based scraping for JS-rendered sites
-            if not is_playwright_available():
-                logging.warning(f"Skipping {source['name']}: Playwright not installed")
-                continue
-            
-            try:
-                playwright_articles = scrape_with_playwright(source, cutoff_date)
-                all_new_articles.extend(playwright_articles)
-            except Exception as e:
-                logging.error(f"Playwright scraping failed for {source['name']}: {e}")
-            continue
-        
-        elif source.get('type') == 'feed':
-            # Feed Parsing (RSS/Atom) using feedparser
-            try:
-                feed = feedparser.parse(source['url'])
-                logging.info(f"Found {len(feed.entries)} entries in feed for {source['name']}.")
-                
-                # Lazy load sitemap if needed
-                sitemap_dates = None
-                if source.get('sitemap_url'):
-                    # Only fetch if we encounter missing dates, or just fetch once?
-                    # Fetching once per source is safer/simpler.
-                    sitemap_dates = fetch_sitemap_dates(source['sitemap_url'])
-
-                for entry in feed.entries:
-                    title = entry.title
-                    link = entry.link
-                    
-                    # feedparser normalizes dates to struct_time in 'published_parsed' or 'updated_parsed'
-                    date_struct = entry.get('published_parsed') or entry.get('updated_parsed')
-                    
-                    pub_date = None
-                    if date_struct:
-                        # Convert struct_time to datetime
-                        pub_date = datetime(*date_struct[:6], tzinfo=timezone.utc)
-                    elif sitemap_dates:
-                        # Fallback to sitemap lookup
-                        norm_link = normalize_url(link)
-                        if norm_link in sitemap_dates:
-                            date_str = sitemap_dates[norm_link]
-                            try:
-                                pub_date = parser.parse(date_str)
-                                if pub_date.tzinfo is None:
-                                    pub_date = pub_date.replace(tzinfo=timezone.utc)
-                            except Exception:
-                                logging.warning(f"Could not parse sitemap date for {link}: {date_str}")
-                    
-                    if not pub_date:
-                        logging.warning(f"No date found for entry: {title}")
-                        continue
-
-                    # Compare dates only (ignore time)
-                    if pub_date.date() >= cutoff_date:
-                        logging.info(f"New article found on {source['name']}: {title} ({pub_date})")
-                        all_new_articles.append({
-                            'source': source['name'],
-                            'title': title,
-                            'date': pub_date.strftime("%Y-%m-%d"),
-                            'url': link,
-                            'timestamp': pub_date.isoformat()
-                        })
-                    else:
-                        logging.debug(f"Skipping old article: {title}")
-
-            except Exception as e:
-                logging.warning(f"Error parsing feed for {source['name']}: {e}")
-                continue
-
-        else:
-            # HTML Scraping (Anthropic)
-            try:
-                response = requests.get(source['url'], timeout=10)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                logging.error(f"Failed to fetch {source['url']}: {e}")
-                continue
+    # Playwright sources run as one task so they share a single browser
+    playwright_sources = [s for s in SOURCES if s.get('type') == 'playwright']
+    http_sources = [s for s in SOURCES if s.get('type') != 'playwright']
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = soup.select(source['article_selector'])
-            logging.info(f"Found {len(articles)} articles on {source['name']}.")
+    # One worker per task (the Playwright group counts as one), capped
+    task_count = len(http_sources) + (1 if playwright_sources else 0)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_SOURCE_WORKERS, task_count))) as executor:
+            futures = [executor.submit(scrape_source, source, cutoff_date) for source in http_sources]
+            if playwright_sources:
+                futures.append(executor.submit(_scrape_playwright_group, playwright_sources, cutoff_date))
 
-            for article in articles:
-                link = None
+            # Collect in submission order so output order is stable
+            all_new_articles = []
+            for future in futures:
                 try:
-                    # Title
-                    title_tag = article.select_one(source['title_selector'])
-                    if not title_tag:
-                        continue
-                    title = title_tag.get_text(strip=True)
-
-                    # Date - use the date_selector from config
-                    date_tag = article.select_one(source['date_selector'])
-                    
-                    if date_tag:
-                        date_str = date_tag.get_text(strip=True)
-                    else:
-                        # Fallback: Fetch detail page if date is missing (e.g. Featured articles)
-                        logging.info(f"Date missing for '{title}', fetching detail page...")
-                        
-                        # Link extraction (needed early for fallback)
-                        if source['link_selector']:
-                            link_tag = article.select_one(source['link_selector'])
-                            link = link_tag.get('href') if link_tag else None
-                        else:
-                            link = article.get('href')
-
-                        if link and not link.startswith('http'):
-                            link = f"{source['base_url']}{link}"
-                            
-                        if not link:
-                            logging.warning(f"Could not find link for date fallback: {title}")
-                            continue
-                            
-                        try:
-                            detail_resp = requests.get(link, timeout=10)
-                            detail_resp.raise_for_status()
-                            detail_soup = BeautifulSoup(detail_resp.content, 'html.parser')
-                            # Try to find date in detail page - look for element with "date" in class
-                            detail_date_tag = detail_soup.select_one('[class*="date"]')
-                            if detail_date_tag:
-                                date_str = detail_date_tag.get_text(strip=True).replace('Published', '').strip()
-                            else:
-                                logging.warning(f"Could not find date in detail page for: {title}")
-                                continue
-                        except Exception as e:
-                            logging.warning(f"Failed to fetch detail page for {link}: {e}")
-                            continue
-
-                    # Parse date
-                    try:
-                        pub_date = parser.parse(date_str)
-                    except Exception:
-                        logging.debug(f"Could not parse date: {date_str}")
-                        continue
-                    
-                    if pub_date.tzinfo is None:
-                        pub_date = pub_date.replace(tzinfo=timezone.utc)
-
-                    # Link (if not already extracted)
-                    if not link:
-                        if source['link_selector']:
-                            link_tag = article.select_one(source['link_selector'])
-                            link = link_tag.get('href') if link_tag else None
-                        else:
-                            link = article.get('href')
-
-                        if link and not link.startswith('http'):
-                            link = f"{source['base_url']}{link}"
-
-                    # Compare dates only (ignore time)
-                    if pub_date.date() >= cutoff_date:
-                        logging.info(f"New article found on {source['name']}: {title} ({date_str})")
-                        all_new_articles.append({
-                            'source': source['name'],
-                            'title': title,
-                            'date': date_str,
-                            'url': link,
-                            'timestamp': pub_date.isoformat()
-                        })
-                    else:
-                        logging.debug(f"Skipping old article: {title} ({date_str})")
-
+                    all_new_articles.extend(future.result())
                 except Exception as e:
-                    logging.warning(f"Error parsing an article on {source['name']}: {e}")
-                    continue
+                    logging.error("Source scraping failed: %s", e)
+    finally:
+        _html_cache.clear()
 
     return all_new_articles
 
-if __name__ == "__main__":
-    # For local testing, look back 30 days
-    found = check_for_new_articles(lookback_hours=24 * 30)
-    print(f"Found {len(found)} new articles.")
-    for art in found:
+def _main():
+    """
+    Local run: prints only articles not already printed by an earlier run.
+    The seen file filters the output; the scrape itself still runs in full.
+    """
+    arg_parser = argparse.ArgumentParser(description="Check the configured blogs for new articles.")
+    arg_parser.add_argument('--hours', type=int, default=24,
+                            help="look back this many hours (default: 24)")
+    arg_parser.add_argument('--seen-file', default=state_path('scraper_seen.json'),
+                            help="seen-URL file of already-printed articles (kept for 30 days)")
+    args = arg_parser.parse_args()
+
+    seen = load_seen_urls(args.seen_file)
+    today = datetime.now(timezone.utc).date().isoformat()
+
+    found = check_for_new_articles(lookback_hours=args.hours)
+    new = [art for art in found if art['url'] not in seen]
+    print(f"Found {len(found)} articles, {len(new)} not seen before.")
+    for art in new:
         print(f"- [{art['source']}] {art['title']} ({art['url']})")
+    for art in found:
+        seen[art['url']] = [art['timestamp'][:10], today]
+
+    save_seen_urls(args.seen_file, seen)
+
+
+if __name__ == "__main__":
+    _main()
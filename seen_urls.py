@@ -0,0 +1,49 @@
+"""
+Small JSON store of article URLs seen in earlier runs, shared by the
+scrapers so repeat runs can skip or hide articles they already handled.
+Stored as {url: [pub_date, last_seen]} with ISO dates. Also holds the
+listing early-stop threshold the scrapers share.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+
+# Entries not seen for this many days are dropped on save
+SEEN_URLS_RETENTION_DAYS = 30
+
+# Listings are newest first. Stop after this many consecutive cards older than
+# the cutoff; a single old card can still appear out of order, e.g. a pinned post.
+MAX_CONSECUTIVE_OLD = 2
+
+
+def load_seen_urls(path):
+    """Loads the {url: [pub_date, last_seen]} map, or an empty dict if unavailable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            seen_urls = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning("Could not load seen URLs from %s: %s", path, e)
+        return {}
+    # Ignore anything not in our format, e.g. a truncated or hand-edited file
+    valid = isinstance(seen_urls, dict) and all(
+        isinstance(entry, list) and len(entry) == 2 and all(isinstance(d, str) for d in entry)
+        for entry in seen_urls.values()
+    )
+    if not valid:
+        logging.warning("Ignoring seen URLs in unexpected format at %s", path)
+        return {}
+    return seen_urls
+
+
+def save_seen_urls(path, seen_urls):
+    """Writes the seen-URL map, dropping entries not seen within the retention window."""
+    try:
+        oldest = (datetime.now(timezone.utc) - timedelta(days=SEEN_URLS_RETENTION_DAYS)).date().isoformat()
+        recent = {url: entry for url, entry in seen_urls.items() if entry[1] >= oldest}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(recent, f)
+    except Exception as e:
+        logging.warning("Could not save seen URLs to %s: %s", path, e)